@@ -291,6 +291,9 @@ type EphemRequest struct {
 	EphemType      EphemType      `protobuf:"varint,2,opt,name=ephem_type,json=ephemType,proto3,enum=api.v1.EphemType" json:"ephem_type,omitempty"`
 	CommonTimeGrid *EphemTimeGrid `protobuf:"bytes,3,opt,name=common_time_grid,json=commonTimeGrid,proto3" json:"common_time_grid,omitempty"`
 	Tasks          []*EphemTask   `protobuf:"bytes,4,rep,name=tasks,proto3" json:"tasks,omitempty"`
+	ChunkPoints    int32          `protobuf:"varint,5,opt,name=chunk_points,json=chunkPoints,proto3" json:"chunk_points,omitempty"`
+	FlatEphemData  bool           `protobuf:"varint,6,opt,name=flat_ephem_data,json=flatEphemData,proto3" json:"flat_ephem_data,omitempty"`
+	BufferHint     bool           `protobuf:"varint,7,opt,name=buffer_hint,json=bufferHint,proto3" json:"buffer_hint,omitempty"`
 }
 
 func (x *EphemRequest) Reset() {
@@ -353,6 +356,27 @@ func (x *EphemRequest) GetTasks() []*EphemTask {
 	return nil
 }
 
+func (x *EphemRequest) GetChunkPoints() int32 {
+	if x != nil {
+		return x.ChunkPoints
+	}
+	return 0
+}
+
+func (x *EphemRequest) GetFlatEphemData() bool {
+	if x != nil {
+		return x.FlatEphemData
+	}
+	return false
+}
+
+func (x *EphemRequest) GetBufferHint() bool {
+	if x != nil {
+		return x.BufferHint
+	}
+	return false
+}
+
 type EphemOut struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -361,6 +385,7 @@ type EphemOut struct {
 	TaskId           int64            `protobuf:"varint,1,opt,name=task_id,json=taskId,proto3" json:"task_id,omitempty"`
 	EphemData        []*EphemerisData `protobuf:"bytes,2,rep,name=ephem_data,json=ephemData,proto3" json:"ephem_data,omitempty"`
 	EphemPointsCount int64            `protobuf:"varint,3,opt,name=ephem_points_count,json=ephemPointsCount,proto3" json:"ephem_points_count,omitempty"`
+	EphemDataFlat    []byte           `protobuf:"bytes,4,opt,name=ephem_data_flat,json=ephemDataFlat,proto3" json:"ephem_data_flat,omitempty"`
 }
 
 func (x *EphemOut) Reset() {
@@ -416,6 +441,13 @@ func (x *EphemOut) GetEphemPointsCount() int64 {
 	return 0
 }
 
+func (x *EphemOut) GetEphemDataFlat() []byte {
+	if x != nil {
+		return x.EphemDataFlat
+	}
+	return nil
+}
+
 type EphemResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -527,8 +559,8 @@ var file_api_v1_core_ephem_proto_rawDesc = []byte{
 	0x6c, 0x6c, 0x69, 0x74, 0x65, 0x52, 0x03, 0x73, 0x61, 0x74, 0x12, 0x32, 0x0a, 0x09, 0x74, 0x69,
 	0x6d, 0x65, 0x5f, 0x67, 0x72, 0x69, 0x64, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x15, 0x2e,
 	0x61, 0x70, 0x69, 0x2e, 0x76, 0x31, 0x2e, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x54, 0x69, 0x6d, 0x65,
-	0x47, 0x72, 0x69, 0x64, 0x52, 0x08, 0x74, 0x69, 0x6d, 0x65, 0x47, 0x72, 0x69, 0x64, 0x22, 0xc1,
-	0x01, 0x0a, 0x0c, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12,
+	0x47, 0x72, 0x69, 0x64, 0x52, 0x08, 0x74, 0x69, 0x6d, 0x65, 0x47, 0x72, 0x69, 0x64, 0x22, 0xad,
+	0x02, 0x0a, 0x0c, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12,
 	0x15, 0x0a, 0x06, 0x72, 0x65, 0x71, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x03, 0x52,
 	0x05, 0x72, 0x65, 0x71, 0x49, 0x64, 0x12, 0x30, 0x0a, 0x0a, 0x65, 0x70, 0x68, 0x65, 0x6d, 0x5f,
 	0x74, 0x79, 0x70, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0e, 0x32, 0x11, 0x2e, 0x61, 0x70, 0x69,
@@ -540,30 +572,40 @@ var file_api_v1_core_ephem_proto_rawDesc = []byte{
 	0x6e, 0x54, 0x69, 0x6d, 0x65, 0x47, 0x72, 0x69, 0x64, 0x12, 0x27, 0x0a, 0x05, 0x74, 0x61, 0x73,
 	0x6b, 0x73, 0x18, 0x04, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x76,
 	0x31, 0x2e, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x54, 0x61, 0x73, 0x6b, 0x52, 0x05, 0x74, 0x61, 0x73,
-	0x6b, 0x73, 0x22, 0x87, 0x01, 0x0a, 0x08, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x4f, 0x75, 0x74, 0x12,
-	0x17, 0x0a, 0x07, 0x74, 0x61, 0x73, 0x6b, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x03,
-	0x52, 0x06, 0x74, 0x61, 0x73, 0x6b, 0x49, 0x64, 0x12, 0x34, 0x0a, 0x0a, 0x65, 0x70, 0x68, 0x65,
-	0x6d, 0x5f, 0x64, 0x61, 0x74, 0x61, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x15, 0x2e, 0x61,
-	0x70, 0x69, 0x2e, 0x76, 0x31, 0x2e, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x65, 0x72, 0x69, 0x73, 0x44,
-	0x61, 0x74, 0x61, 0x52, 0x09, 0x65, 0x70, 0x68, 0x65, 0x6d, 0x44, 0x61, 0x74, 0x61, 0x12, 0x2c,
-	0x0a, 0x12, 0x65, 0x70, 0x68, 0x65, 0x6d, 0x5f, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x73, 0x5f, 0x63,
-	0x6f, 0x75, 0x6e, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28, 0x03, 0x52, 0x10, 0x65, 0x70, 0x68, 0x65,
-	0x6d, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x73, 0x43, 0x6f, 0x75, 0x6e, 0x74, 0x22, 0x95, 0x01, 0x0a,
-	0x0d, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x15,
-	0x0a, 0x06, 0x72, 0x65, 0x71, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x03, 0x52, 0x05,
-	0x72, 0x65, 0x71, 0x49, 0x64, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x74, 0x72, 0x65, 0x61, 0x6d, 0x5f,
-	0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x03, 0x52, 0x08, 0x73, 0x74, 0x72, 0x65, 0x61, 0x6d,
-	0x49, 0x64, 0x12, 0x26, 0x0a, 0x0f, 0x73, 0x74, 0x72, 0x65, 0x61, 0x6d, 0x5f, 0x63, 0x68, 0x75,
-	0x6e, 0x6b, 0x5f, 0x69, 0x64, 0x18, 0x03, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0d, 0x73, 0x74, 0x72,
-	0x65, 0x61, 0x6d, 0x43, 0x68, 0x75, 0x6e, 0x6b, 0x49, 0x64, 0x12, 0x28, 0x0a, 0x06, 0x72, 0x65,
-	0x73, 0x75, 0x6c, 0x74, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x10, 0x2e, 0x61, 0x70, 0x69,
-	0x2e, 0x76, 0x31, 0x2e, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x4f, 0x75, 0x74, 0x52, 0x06, 0x72, 0x65,
-	0x73, 0x75, 0x6c, 0x74, 0x2a, 0x3d, 0x0a, 0x09, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x54, 0x79, 0x70,
-	0x65, 0x12, 0x14, 0x0a, 0x10, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x50, 0x6c, 0x61, 0x63, 0x65, 0x68,
-	0x6f, 0x6c, 0x64, 0x65, 0x72, 0x10, 0x00, 0x12, 0x0c, 0x0a, 0x08, 0x45, 0x70, 0x68, 0x65, 0x6d,
-	0x45, 0x63, 0x69, 0x10, 0x01, 0x12, 0x0c, 0x0a, 0x08, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x4a, 0x32,
-	0x4b, 0x10, 0x02, 0x42, 0x13, 0x5a, 0x11, 0x61, 0x70, 0x69, 0x2f, 0x76, 0x31, 0x2f, 0x67, 0x65,
-	0x6e, 0x2f, 0x3b, 0x61, 0x70, 0x69, 0x76, 0x31, 0x62, 0x06, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x33,
+	0x6b, 0x73, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x75, 0x6e, 0x6b, 0x5f, 0x70, 0x6f, 0x69, 0x6e,
+	0x74, 0x73, 0x18, 0x05, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x75, 0x6e, 0x6b, 0x50,
+	0x6f, 0x69, 0x6e, 0x74, 0x73, 0x12, 0x26, 0x0a, 0x0f, 0x66, 0x6c, 0x61, 0x74, 0x5f, 0x65, 0x70,
+	0x68, 0x65, 0x6d, 0x5f, 0x64, 0x61, 0x74, 0x61, 0x18, 0x06, 0x20, 0x01, 0x28, 0x08, 0x52, 0x0d,
+	0x66, 0x6c, 0x61, 0x74, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x44, 0x61, 0x74, 0x61, 0x12, 0x1f, 0x0a,
+	0x0b, 0x62, 0x75, 0x66, 0x66, 0x65, 0x72, 0x5f, 0x68, 0x69, 0x6e, 0x74, 0x18, 0x07, 0x20, 0x01,
+	0x28, 0x08, 0x52, 0x0a, 0x62, 0x75, 0x66, 0x66, 0x65, 0x72, 0x48, 0x69, 0x6e, 0x74, 0x22, 0xaf,
+	0x01, 0x0a, 0x08, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x4f, 0x75, 0x74, 0x12, 0x17, 0x0a, 0x07, 0x74,
+	0x61, 0x73, 0x6b, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x03, 0x52, 0x06, 0x74, 0x61,
+	0x73, 0x6b, 0x49, 0x64, 0x12, 0x34, 0x0a, 0x0a, 0x65, 0x70, 0x68, 0x65, 0x6d, 0x5f, 0x64, 0x61,
+	0x74, 0x61, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x15, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x76,
+	0x31, 0x2e, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x65, 0x72, 0x69, 0x73, 0x44, 0x61, 0x74, 0x61, 0x52,
+	0x09, 0x65, 0x70, 0x68, 0x65, 0x6d, 0x44, 0x61, 0x74, 0x61, 0x12, 0x2c, 0x0a, 0x12, 0x65, 0x70,
+	0x68, 0x65, 0x6d, 0x5f, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x73, 0x5f, 0x63, 0x6f, 0x75, 0x6e, 0x74,
+	0x18, 0x03, 0x20, 0x01, 0x28, 0x03, 0x52, 0x10, 0x65, 0x70, 0x68, 0x65, 0x6d, 0x50, 0x6f, 0x69,
+	0x6e, 0x74, 0x73, 0x43, 0x6f, 0x75, 0x6e, 0x74, 0x12, 0x26, 0x0a, 0x0f, 0x65, 0x70, 0x68, 0x65,
+	0x6d, 0x5f, 0x64, 0x61, 0x74, 0x61, 0x5f, 0x66, 0x6c, 0x61, 0x74, 0x18, 0x04, 0x20, 0x01, 0x28,
+	0x0c, 0x52, 0x0d, 0x65, 0x70, 0x68, 0x65, 0x6d, 0x44, 0x61, 0x74, 0x61, 0x46, 0x6c, 0x61, 0x74,
+	0x22, 0x95, 0x01, 0x0a, 0x0d, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
+	0x73, 0x65, 0x12, 0x15, 0x0a, 0x06, 0x72, 0x65, 0x71, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01,
+	0x28, 0x03, 0x52, 0x05, 0x72, 0x65, 0x71, 0x49, 0x64, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x74, 0x72,
+	0x65, 0x61, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x03, 0x52, 0x08, 0x73, 0x74,
+	0x72, 0x65, 0x61, 0x6d, 0x49, 0x64, 0x12, 0x26, 0x0a, 0x0f, 0x73, 0x74, 0x72, 0x65, 0x61, 0x6d,
+	0x5f, 0x63, 0x68, 0x75, 0x6e, 0x6b, 0x5f, 0x69, 0x64, 0x18, 0x03, 0x20, 0x01, 0x28, 0x03, 0x52,
+	0x0d, 0x73, 0x74, 0x72, 0x65, 0x61, 0x6d, 0x43, 0x68, 0x75, 0x6e, 0x6b, 0x49, 0x64, 0x12, 0x28,
+	0x0a, 0x06, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x10,
+	0x2e, 0x61, 0x70, 0x69, 0x2e, 0x76, 0x31, 0x2e, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x4f, 0x75, 0x74,
+	0x52, 0x06, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x2a, 0x3d, 0x0a, 0x09, 0x45, 0x70, 0x68, 0x65,
+	0x6d, 0x54, 0x79, 0x70, 0x65, 0x12, 0x14, 0x0a, 0x10, 0x45, 0x70, 0x68, 0x65, 0x6d, 0x50, 0x6c,
+	0x61, 0x63, 0x65, 0x68, 0x6f, 0x6c, 0x64, 0x65, 0x72, 0x10, 0x00, 0x12, 0x0c, 0x0a, 0x08, 0x45,
+	0x70, 0x68, 0x65, 0x6d, 0x45, 0x63, 0x69, 0x10, 0x01, 0x12, 0x0c, 0x0a, 0x08, 0x45, 0x70, 0x68,
+	0x65, 0x6d, 0x4a, 0x32, 0x4b, 0x10, 0x02, 0x42, 0x13, 0x5a, 0x11, 0x61, 0x70, 0x69, 0x2f, 0x76,
+	0x31, 0x2f, 0x67, 0x65, 0x6e, 0x2f, 0x3b, 0x61, 0x70, 0x69, 0x76, 0x31, 0x62, 0x06, 0x70, 0x72,
+	0x6f, 0x74, 0x6f, 0x33,
 }
 
 var (
@@ -26,6 +26,7 @@ type PropagatorClient interface {
 	Info(ctx context.Context, in *emptypb.Empty, opts ...grpc.CallOption) (*InfoResponse, error)
 	Prop(ctx context.Context, in *PropRequest, opts ...grpc.CallOption) (*PropResponse, error)
 	Ephem(ctx context.Context, in *EphemRequest, opts ...grpc.CallOption) (Propagator_EphemClient, error)
+	PropStream(ctx context.Context, in *PropRequest, opts ...grpc.CallOption) (Propagator_PropStreamClient, error)
 }
 
 type propagatorClient struct {
@@ -86,6 +87,38 @@ func (x *propagatorEphemClient) Recv() (*EphemResponse, error) {
 	return m, nil
 }
 
+func (c *propagatorClient) PropStream(ctx context.Context, in *PropRequest, opts ...grpc.CallOption) (Propagator_PropStreamClient, error) {
+	stream, err := c.cc.NewStream(ctx, &Propagator_ServiceDesc.Streams[1], "/api.v1.Propagator/PropStream", opts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &propagatorPropStreamClient{stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+type Propagator_PropStreamClient interface {
+	Recv() (*PropResponse, error)
+	grpc.ClientStream
+}
+
+type propagatorPropStreamClient struct {
+	grpc.ClientStream
+}
+
+func (x *propagatorPropStreamClient) Recv() (*PropResponse, error) {
+	m := new(PropResponse)
+	if err := x.ClientStream.RecvMsg(m); err != nil {
+		return nil, err
+	}
+	return m, nil
+}
+
 // PropagatorServer is the server API for Propagator service.
 // All implementations must embed UnimplementedPropagatorServer
 // for forward compatibility
@@ -93,6 +126,7 @@ type PropagatorServer interface {
 	Info(context.Context, *emptypb.Empty) (*InfoResponse, error)
 	Prop(context.Context, *PropRequest) (*PropResponse, error)
 	Ephem(*EphemRequest, Propagator_EphemServer) error
+	PropStream(*PropRequest, Propagator_PropStreamServer) error
 	mustEmbedUnimplementedPropagatorServer()
 }
 
@@ -109,6 +143,9 @@ func (UnimplementedPropagatorServer) Prop(context.Context, *PropRequest) (*PropR
 func (UnimplementedPropagatorServer) Ephem(*EphemRequest, Propagator_EphemServer) error {
 	return status.Errorf(codes.Unimplemented, "method Ephem not implemented")
 }
+func (UnimplementedPropagatorServer) PropStream(*PropRequest, Propagator_PropStreamServer) error {
+	return status.Errorf(codes.Unimplemented, "method PropStream not implemented")
+}
 func (UnimplementedPropagatorServer) mustEmbedUnimplementedPropagatorServer() {}
 
 // UnsafePropagatorServer may be embedded to opt out of forward compatibility for this service.
@@ -179,6 +216,27 @@ func (x *propagatorEphemServer) Send(m *EphemResponse) error {
 	return x.ServerStream.SendMsg(m)
 }
 
+func _Propagator_PropStream_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(PropRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(PropagatorServer).PropStream(m, &propagatorPropStreamServer{stream})
+}
+
+type Propagator_PropStreamServer interface {
+	Send(*PropResponse) error
+	grpc.ServerStream
+}
+
+type propagatorPropStreamServer struct {
+	grpc.ServerStream
+}
+
+func (x *propagatorPropStreamServer) Send(m *PropResponse) error {
+	return x.ServerStream.SendMsg(m)
+}
+
 // Propagator_ServiceDesc is the grpc.ServiceDesc for Propagator service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -201,6 +259,11 @@ var Propagator_ServiceDesc = grpc.ServiceDesc{
 			Handler:       _Propagator_Ephem_Handler,
 			ServerStreams: true,
 		},
+		{
+			StreamName:    "PropStream",
+			Handler:       _Propagator_PropStream_Handler,
+			ServerStreams: true,
+		},
 	},
 	Metadata: "api/v1/main.proto",
 }
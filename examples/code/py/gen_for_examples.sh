@@ -33,7 +33,7 @@ source "$VENV_DIR/bin/activate"
 
 echo "==> Installing dependencies..."
 pip install --upgrade pip > /dev/null
-pip install grpcio grpcio-tools googleapis-common-protos cryptography protobuf > /dev/null
+pip install grpcio grpcio-tools googleapis-common-protos cryptography "protobuf>=4.21" numpy > /dev/null
 
 chmod +x _gen_py.sh
 ./_gen_py.sh ../../../../xpropagator .
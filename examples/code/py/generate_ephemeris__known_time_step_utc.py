@@ -20,80 +20,147 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+import argparse
+import asyncio
 import grpc
 import logging
+import sys
 import time
-from datetime import datetime, timezone
-from helper import get_tls_config
+from helper import new_aio_channel, setup_logging
 
 from google.protobuf.timestamp_pb2 import Timestamp
 from api.v1.core import ephem_pb2
 from api.v1 import common_pb2
-from api.v1 import main_pb2_grpc
 
+logger = logging.getLogger(__name__)
+
+# December 18, 2025 - December 28, 2025, 00:00:00 UTC as Unix seconds.
+TIME_START_UTC_SECONDS = 1766016000
+TIME_END_UTC_SECONDS = TIME_START_UTC_SECONDS + 10 * 86400
+SECONDS_PER_DAY = 86400
+
+# PT8.5M in seconds. Every window spans a whole number of steps, so each window starts on the
+# grid of the full range and together they sample exactly the same epochs as a single request.
+TIME_STEP_SECONDS = 510
+WINDOW_SECONDS = 170 * TIME_STEP_SECONDS
+
+
+def make_ephem_req(req_id, time_start_utc, time_end_utc):
+    return ephem_pb2.EphemRequest(
+        req_id=req_id,
+        ephem_type=ephem_pb2.EphemType.EphemJ2K,
+        common_time_grid=ephem_pb2.EphemTimeGrid(
+            time_start_utc=time_start_utc,
+            time_end_utc=time_end_utc,
+            known_time_step_period="PT8.5M",
+        ),
+        tasks=[
+            ephem_pb2.EphemTask(
+                task_id=10,
+                sat=common_pb2.Satellite(
+                    norad_id=65271,
+                    name="X-37B Orbital Test Vehicle 8 (OTV 8)",
+                    tle_ln1="1 65271U 25183A   25282.36302114 0.00010000  00000-0  55866-4 0    07",
+                    tle_ln2="2 65271  48.7951   8.5514 0002000  85.4867 277.3551 15.78566782    05",
+                ),
+            ),
+        ],
+        chunk_points=512,
+        flat_ephem_data=True,
+        buffer_hint=True,
+    )
 
-def main():
-    grpc_creds = get_tls_config()
 
-    options = (
-        ("grpc.ssl_target_name_override", "xpropagator-server"),
-    )
+async def run_ephem(ephem_call, payload):
+    chunks = []
+
+    async for resp in ephem_call(payload, compression=grpc.Compression.Gzip):
+        logger.info(
+            "api.v1.Propagator.Ephem stream chunk received: "
+            "ReqId: %d, TaskId: %d, StreamId: %d, StreamChunkId: %d, EphemerisCount: %d",
+            resp.req_id,
+            resp.result.task_id,
+            resp.stream_id,
+            resp.stream_chunk_id,
+            resp.result.ephem_points_count,
+        )
+        chunks.append(resp.result.ephem_data_flat)
+
+    return chunks
+
+
+def merge_windows(windows):
+    # numpy is by far the most expensive import of this script, so it is only loaded here, once
+    # every stream has been received (not for --help, nor when any of the RPCs fails).
+    import numpy as np
+
+    merged = []
+    half_step_days = TIME_STEP_SECONDS / SECONDS_PER_DAY / 2
+
+    for chunks in windows:
+        # Little-endian doubles, 7 per point: ds50 time, x, y, z, vx, vy, vz. No Python float is
+        # created per value, the bytes are used as the array buffer.
+        states = np.frombuffer(b"".join(chunks), dtype="<f8").reshape(-1, 7)
 
+        # Neighbouring windows share their boundary epoch, keep it only once.
+        if merged and len(merged[-1]):
+            states = states[states[:, 0] > merged[-1][-1, 0] + half_step_days]
+        merged.append(states)
+
+    states = np.concatenate(merged) if merged else np.empty((0, 7))
+
+    if logger.isEnabledFor(logging.DEBUG):
+        # Without the threshold numpy summarizes arrays above 1000 elements with "...".
+        logger.debug("\n%s", np.array2string(states, threshold=sys.maxsize))
+
+    return states
+
+
+async def main():
     try:
-        with grpc.secure_channel("localhost:50051", grpc_creds, options) as channel:
-            client = main_pb2_grpc.PropagatorStub(channel)
-
-            time_start = time.time()
-
-            def make_ts(y, m, d):
-                ts = Timestamp()
-                ts.FromDatetime(datetime(y, m, d, 0, 0, 0, tzinfo=timezone.utc))
-                return ts
-
-            ephem_req = ephem_pb2.EphemRequest(
-                req_id=1,
-                ephem_type=ephem_pb2.EphemType.EphemJ2K,
-                common_time_grid=ephem_pb2.EphemTimeGrid(
-                    time_start_utc=make_ts(2025, 12, 18),
-                    time_end_utc=make_ts(2025, 12, 28),
-                    known_time_step_period="PT8.5M",
-                ),
-                tasks=[
-                    ephem_pb2.EphemTask(
-                        task_id=10,
-                        sat=common_pb2.Satellite(
-                            norad_id=65271,
-                            name="X-37B Orbital Test Vehicle 8 (OTV 8)",
-                            tle_ln1="1 65271U 25183A   25282.36302114 0.00010000  00000-0  55866-4 0    07",
-                            tle_ln2="2 65271  48.7951   8.5514 0002000  85.4867 277.3551 15.78566782    05",
-                        ),
-                    ),
-                ],
+        async with new_aio_channel() as channel:
+            # Raw call without a request serializer: it takes the already encoded request bytes.
+            ephem_call = channel.unary_stream(
+                "/api.v1.Propagator/Ephem",
+                request_serializer=None,
+                response_deserializer=ephem_pb2.EphemResponse.FromString,
             )
 
-            stream = client.Ephem(ephem_req)
-
-            for resp in stream:
-                logging.info(
-                    "api.v1.Propagator.Ephem stream chunk received:\n"
-                    f"ReqId: {resp.req_id}\n"
-                    f"TaskId: {resp.result.task_id}\n"
-                    f"StreamId: {resp.stream_id}\n"
-                    f"StreamChunkId: {resp.stream_chunk_id}\n"
-                    f"EphemerisCount: {resp.result.ephem_points_count}"
+            time_start = time.perf_counter()
+
+            # The range is split into ~1 day windows, each window is its own Ephem stream, all of
+            # them multiplexed over the same channel. The server still generates the streams one
+            # after another, so this does not make the propagation itself faster.
+            # Serialize once, the same payload can be sent again without re-encoding.
+            payloads = [
+                make_ephem_req(
+                    req_id,
+                    Timestamp(seconds=start),
+                    Timestamp(seconds=min(start + WINDOW_SECONDS, TIME_END_UTC_SECONDS)),
+                ).SerializeToString()
+                for req_id, start in enumerate(
+                    range(TIME_START_UTC_SECONDS, TIME_END_UTC_SECONDS, WINDOW_SECONDS), start=1
                 )
+            ]
 
-                for ephem_data in resp.result.ephem_data:
-                    logging.info(ephem_data)
+            windows = await asyncio.gather(*(run_ephem(ephem_call, payload) for payload in payloads))
 
-            logging.info(
-                f"api.v1.Propagator.Ephem done, time took: {time.time() - time_start:.2f}s"
+            states = merge_windows(windows)
+
+            logger.info(
+                "api.v1.Propagator.Ephem done, points: %d, time took: %.2fs",
+                len(states),
+                time.perf_counter() - time_start,
             )
 
     except grpc.RpcError as e:
-        logging.error(f"Failed to request api.v1.Propagator.Ephem: {e}")
+        logger.error("Failed to request api.v1.Propagator.Ephem: %s", e)
 
 
 if __name__ == "__main__":
-    logging.basicConfig(level=logging.INFO)
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--verbose", action="store_true", help="log every ephemeris point")
+    args = parser.parse_args()
+
+    setup_logging(logging.DEBUG if args.verbose else logging.INFO)
+    asyncio.run(main())
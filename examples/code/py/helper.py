@@ -20,7 +20,46 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+import os
+
+# Must happen before any generated *_pb2 module is imported, so examples import helper first.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+import atexit
 import grpc
+import logging
+import logging.handlers
+import queue
+from grpc.experimental import session_cache
+from google.protobuf.internal import api_implementation
+
+if api_implementation.Type() != "upb":
+    logging.getLogger(__name__).warning(
+        "protobuf '%s' backend in use, install protobuf>=4.21 for the faster upb backend",
+        api_implementation.Type(),
+    )
+
+SERVICE_ADDR = "localhost:50051"
+
+CHANNEL_OPTIONS = (
+    ("grpc.http2.max_frame_size", 16777215),
+    ("grpc.http2.bdp_probe", 1),
+    ("grpc.http2.lookahead_bytes", 8 * 1024 * 1024),
+    ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+    ("grpc.keepalive_time_ms", 30000),
+)
+
+# Shared by every TLS channel of the process, so reconnects and extra channels resume the TLS
+# session (one round trip less, no certificate exchange/verification) instead of a full handshake.
+SSL_SESSION_CACHE = session_cache.ssl_session_cache_lru(1024)
+
+TLS_CHANNEL_OPTIONS = CHANNEL_OPTIONS + (
+    ("grpc.ssl_target_name_override", "xpropagator-server"),
+    ("grpc.ssl_session_cache", SSL_SESSION_CACHE),
+)
+
+_channels = {}
+
 
 # Run examples from project root: python examples/code/py/...
 def get_tls_config():
@@ -37,4 +76,38 @@ def get_tls_config():
         certificate_chain=client_cert
     )
 
-    return grpc_creds
\ No newline at end of file
+    return grpc_creds
+
+
+# One channel per process, so every RPC is multiplexed over the same HTTP/2 connection
+# instead of paying the TCP (+TLS) handshake again. Closed automatically at exit.
+def get_channel(secure=True):
+    channel = _channels.get(secure)
+    if channel is None:
+        if secure:
+            channel = grpc.secure_channel(SERVICE_ADDR, get_tls_config(), TLS_CHANNEL_OPTIONS)
+        else:
+            channel = grpc.insecure_channel(SERVICE_ADDR, CHANNEL_OPTIONS)
+        atexit.register(channel.close)
+        _channels[secure] = channel
+    return channel
+
+
+# asyncio flavour of get_channel(). An aio channel is bound to the running event loop,
+# so it is not memoized; use it as `async with new_aio_channel() as channel:`.
+def new_aio_channel(secure=True):
+    if secure:
+        return grpc.aio.secure_channel(SERVICE_ADDR, get_tls_config(), TLS_CHANNEL_OPTIONS)
+    return grpc.aio.insecure_channel(SERVICE_ADDR, CHANNEL_OPTIONS)
+
+
+# Log calls only put the record on a queue, the (possibly slow) stderr write happens on the
+# listener thread, so logging in a stream loop does not hold up reading the next message.
+def setup_logging(level=logging.INFO):
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(level=level, handlers=[logging.handlers.QueueHandler(log_queue)])
+
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
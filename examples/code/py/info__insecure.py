@@ -20,28 +20,29 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+from helper import get_channel
 from google.protobuf.empty_pb2 import Empty
 from api.v1 import main_pb2_grpc
 import grpc
 import logging
 
 def main():
-    try:
-        with grpc.insecure_channel("localhost:50051") as channel:
-            client = main_pb2_grpc.PropagatorStub(channel)
+    channel = get_channel(secure=False)
+    client = main_pb2_grpc.PropagatorStub(channel)
 
-            response = client.Info(Empty())
+    try:
+        response = client.Info(Empty())
 
-            logging.info(
-                "api.v1.Propagator.Info response:\n"
-                f"Name: {response.name}\n"
-                f"Version: {response.version}\n"
-                f"Commit: {response.commit}\n"
-                f"BuildDate: {response.build_date}\n"
-                f"AstroStdLibInfo: {response.astro_std_lib_info}\n"
-                f"Sgp4LibInfo: {response.sgp4_lib_info}\n"
-                f"Timestamp: {response.timestamp.ToDatetime()}"
-            )
+        logging.info(
+            "api.v1.Propagator.Info response:\n"
+            f"Name: {response.name}\n"
+            f"Version: {response.version}\n"
+            f"Commit: {response.commit}\n"
+            f"BuildDate: {response.build_date}\n"
+            f"AstroStdLibInfo: {response.astro_std_lib_info}\n"
+            f"Sgp4LibInfo: {response.sgp4_lib_info}\n"
+            f"Timestamp: {response.timestamp.ToDatetime()}"
+        )
 
     except grpc.RpcError as e:
         logging.error(f"Failed to request api.v1.Propagator.Info: {e}")
@@ -23,44 +23,57 @@
 import grpc
 import logging
 import time
+from helper import get_channel, setup_logging
 
 from api.v1.core import prop_pb2
 from api.v1 import common_pb2
 from api.v1 import main_pb2_grpc
 
+# Built once, per call only req_id and time are filled in on a copy.
+_TEMPLATE_REQ = prop_pb2.PropRequest(
+    time_type=prop_pb2.TimeType.TimeDs50,
+    task=prop_pb2.PropTask(
+        sat=common_pb2.Satellite(
+            norad_id=65271,
+            name="X-37B Orbital Test Vehicle 8 (OTV 8)",
+            tle_ln1="1 65271U 25183A   25282.36302114 0.00010000  00000-0  55866-4 0    07",
+            tle_ln2="2 65271  48.7951   8.5514 0002000  85.4867 277.3551 15.78566782    05",
+        ),
+    ),
+)
+
 def main():
+    channel = get_channel(secure=False)
+    client = main_pb2_grpc.PropagatorStub(channel)
+
     try:
-        with grpc.insecure_channel("localhost:50051") as channel:
-            client = main_pb2_grpc.PropagatorStub(channel)
+        time_start = time.perf_counter()
 
-            time_start = time.time()
+        times = (27744.5, 27744.75, 27745.0, 27745.25)
 
-            prop_req = prop_pb2.PropRequest(
-                req_id=1,
-                time_type=prop_pb2.TimeType.TimeDs50,
-                task=prop_pb2.PropTask(
-                    time=27744.5,
-                    sat=common_pb2.Satellite(
-                        norad_id=65271,
-                        name="X-37B Orbital Test Vehicle 8 (OTV 8)",
-                        tle_ln1="1 65271U 25183A   25282.36302114 0.00010000  00000-0  55866-4 0    07",
-                        tle_ln2="2 65271  48.7951   8.5514 0002000  85.4867 277.3551 15.78566782    05",
-                    ),
-                ),
-            )
+        # Fire all calls at once, they are multiplexed over the shared channel,
+        # and build the next request while the previous ones are in flight.
+        futures = []
+        for req_id, t in enumerate(times, start=1):
+            prop_req = prop_pb2.PropRequest()
+            prop_req.CopyFrom(_TEMPLATE_REQ)
+            prop_req.req_id = req_id
+            prop_req.task.time = t
+            futures.append(client.Prop.future(prop_req))
 
-            resp = client.Prop(prop_req)
+        for future in futures:
+            resp = future.result()
+            logging.info("api.v1.Propagator.Prop ReqId: %d\n%s", resp.req_id, resp.result)
 
-            logging.info(
-                "api.v1.Propagator.Prop done, time took: %.2fs\n%s",
-                time.time() - time_start,
-                resp.result
-            )
+        logging.info(
+            "api.v1.Propagator.Prop done, time took: %.2fs",
+            time.perf_counter() - time_start,
+        )
 
     except grpc.RpcError as e:
         logging.error(f"Failed to request api.v1.Propagator.Prop: {e}")
 
 
 if __name__ == "__main__":
-    logging.basicConfig(level=logging.INFO)
+    setup_logging()
     main()
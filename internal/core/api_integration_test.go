@@ -31,7 +31,9 @@ package core
 
 import (
 	"context"
+	"encoding/binary"
 	"io"
+	"math"
 	"net"
 	"testing"
 	"time"
@@ -41,7 +43,9 @@ import (
 	"github.com/xpropagation/xpropagator/internal/core/gc"
 	"go.uber.org/zap"
 	"google.golang.org/grpc"
+	"google.golang.org/grpc/codes"
 	"google.golang.org/grpc/credentials/insecure"
+	"google.golang.org/grpc/status"
 	"google.golang.org/grpc/test/bufconn"
 	"google.golang.org/protobuf/types/known/emptypb"
 	"google.golang.org/protobuf/types/known/timestamppb"
@@ -399,6 +403,214 @@ func TestAPI_Prop_MultipleSatellites(t *testing.T) {
 	}
 }
 
+// =============================================================================
+// PropStream API Tests
+// =============================================================================
+
+func TestAPI_PropStream_DS50Times(t *testing.T) {
+	ts := newTestServer(t)
+	defer ts.close()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
+	defer cancel()
+
+	conn, err := ts.dial(ctx)
+	if err != nil {
+		t.Fatalf("Failed to dial: %v", err)
+	}
+	defer conn.Close()
+
+	client := apiv1.NewPropagatorClient(conn)
+
+	sat := &apiv1.Satellite{
+		NoradId: testNoradID,
+		Name:    testSatName,
+		TleLn1:  testTLELine1,
+		TleLn2:  testTLELine2,
+	}
+	times := []float64{27744.5, 27744.75, 27745.0, 27745.25}
+
+	stream, err := client.PropStream(ctx, &apiv1.PropRequest{
+		ReqId:    5,
+		TimeType: apiv1.TimeType_TimeDs50,
+		Task:     &apiv1.PropTask{Sat: sat},
+		Times:    times,
+	})
+	if err != nil {
+		t.Fatalf("PropStream() failed: %v", err)
+	}
+
+	var responses []*apiv1.PropResponse
+	for {
+		resp, err := stream.Recv()
+		if err == io.EOF {
+			break
+		}
+		if err != nil {
+			t.Fatalf("Stream recv failed: %v", err)
+		}
+		responses = append(responses, resp)
+	}
+
+	// Verify one response per time
+	if len(responses) != len(times) {
+		t.Fatalf("Got %d responses, want %d", len(responses), len(times))
+	}
+
+	for i, resp := range responses {
+		if resp.GetReqId() != 5 {
+			t.Errorf("Response %d: ReqId = %d, want 5", i, resp.GetReqId())
+		}
+
+		// Verify request order by comparing with a unary Prop at the same time
+		want, err := client.Prop(ctx, &apiv1.PropRequest{
+			ReqId:    int64(i),
+			TimeType: apiv1.TimeType_TimeDs50,
+			Task:     &apiv1.PropTask{Time: times[i], Sat: sat},
+		})
+		if err != nil {
+			t.Fatalf("Prop() failed: %v", err)
+		}
+
+		got := resp.GetResult()
+		if got.GetDs50Time() != want.GetResult().GetDs50Time() ||
+			got.GetX() != want.GetResult().GetX() ||
+			got.GetY() != want.GetResult().GetY() ||
+			got.GetZ() != want.GetResult().GetZ() {
+			t.Errorf("Response %d: DS50=%f Pos=[%f, %f, %f], Prop at %f gives DS50=%f Pos=[%f, %f, %f]",
+				i, got.GetDs50Time(), got.GetX(), got.GetY(), got.GetZ(),
+				times[i], want.GetResult().GetDs50Time(), want.GetResult().GetX(), want.GetResult().GetY(), want.GetResult().GetZ())
+		}
+	}
+
+	t.Logf("PropStream returned %d results in request order", len(responses))
+}
+
+func TestAPI_PropStream_InvalidArgument(t *testing.T) {
+	ts := newTestServer(t)
+	defer ts.close()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+
+	conn, err := ts.dial(ctx)
+	if err != nil {
+		t.Fatalf("Failed to dial: %v", err)
+	}
+	defer conn.Close()
+
+	client := apiv1.NewPropagatorClient(conn)
+
+	sat := &apiv1.Satellite{
+		NoradId: testNoradID,
+		Name:    testSatName,
+		TleLn1:  testTLELine1,
+		TleLn2:  testTLELine2,
+	}
+
+	tests := []struct {
+		name string
+		req  *apiv1.PropRequest
+	}{
+		{
+			name: "empty times",
+			req: &apiv1.PropRequest{
+				ReqId:    6,
+				TimeType: apiv1.TimeType_TimeDs50,
+				Task:     &apiv1.PropTask{Sat: sat},
+			},
+		},
+		{
+			name: "task time set",
+			req: &apiv1.PropRequest{
+				ReqId:    7,
+				TimeType: apiv1.TimeType_TimeDs50,
+				Task:     &apiv1.PropTask{Time: 27744.5, Sat: sat},
+				Times:    []float64{27744.75},
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			stream, err := client.PropStream(ctx, tt.req)
+			if err == nil {
+				_, err = stream.Recv()
+			}
+			if status.Code(err) != codes.InvalidArgument {
+				t.Errorf("Expected InvalidArgument, got: %v", err)
+			}
+		})
+	}
+}
+
+func TestAPI_PropStream_ContextCancellation(t *testing.T) {
+	ts := newTestServer(t)
+	defer ts.close()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
+	defer cancel()
+
+	conn, err := ts.dial(ctx)
+	if err != nil {
+		t.Fatalf("Failed to dial: %v", err)
+	}
+	defer conn.Close()
+
+	client := apiv1.NewPropagatorClient(conn)
+
+	// Far more responses than fit in the flow control windows, so the server cannot finish
+	// before the client cancels
+	times := make([]float64, 100000)
+	for i := range times {
+		times[i] = 27744.0 + float64(i)*0.0001
+	}
+
+	streamCtx, streamCancel := context.WithCancel(ctx)
+	defer streamCancel()
+
+	stream, err := client.PropStream(streamCtx, &apiv1.PropRequest{
+		ReqId:    8,
+		TimeType: apiv1.TimeType_TimeDs50,
+		Task: &apiv1.PropTask{
+			Sat: &apiv1.Satellite{
+				NoradId: testNoradID,
+				Name:    testSatName,
+				TleLn1:  testTLELine1,
+				TleLn2:  testTLELine2,
+			},
+		},
+		Times: times,
+	})
+	if err != nil {
+		t.Fatalf("PropStream() failed: %v", err)
+	}
+
+	if _, err := stream.Recv(); err != nil {
+		t.Fatalf("First recv failed: %v", err)
+	}
+	received := 1
+
+	streamCancel()
+
+	for {
+		_, err = stream.Recv()
+		if err != nil {
+			break
+		}
+		received++
+	}
+
+	if status.Code(err) != codes.Canceled {
+		t.Errorf("Expected Canceled, got: %v", err)
+	}
+	if received >= len(times) {
+		t.Errorf("Received all %d responses despite cancellation", received)
+	}
+
+	t.Logf("Received %d of %d responses before cancellation", received, len(times))
+}
+
 // =============================================================================
 // Ephem API Tests
 // =============================================================================
@@ -1440,6 +1652,263 @@ func TestAPI_Ephem_ContextCancellation(t *testing.T) {
 	t.Logf("Received %d points before cancellation", receivedPoints)
 }
 
+// recvAllEphem runs an Ephem request and collects every stream chunk until EOF
+func recvAllEphem(ctx context.Context, t *testing.T, client apiv1.PropagatorClient, req *apiv1.EphemRequest) []*apiv1.EphemResponse {
+	t.Helper()
+
+	stream, err := client.Ephem(ctx, req)
+	if err != nil {
+		t.Fatalf("Ephem() failed: %v", err)
+	}
+
+	var responses []*apiv1.EphemResponse
+	for {
+		resp, err := stream.Recv()
+		if err == io.EOF {
+			break
+		}
+		if err != nil {
+			t.Fatalf("Stream recv failed: %v", err)
+		}
+		responses = append(responses, resp)
+	}
+	return responses
+}
+
+func TestAPI_Ephem_ChunkPoints(t *testing.T) {
+	ts := newTestServer(t)
+	defer ts.close()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 60*time.Second)
+	defer cancel()
+
+	conn, err := ts.dial(ctx)
+	if err != nil {
+		t.Fatalf("Failed to dial: %v", err)
+	}
+	defer conn.Close()
+
+	client := apiv1.NewPropagatorClient(conn)
+
+	const chunkPoints = 25
+
+	newReq := func(chunkPoints int32) *apiv1.EphemRequest {
+		return &apiv1.EphemRequest{
+			ReqId:     95,
+			EphemType: apiv1.EphemType_EphemEci,
+			CommonTimeGrid: &apiv1.EphemTimeGrid{
+				TimeStartDs50: 27744.0,
+				TimeEndDs50:   27744.1,
+				TimeStepType: &apiv1.EphemTimeGrid_KnownTimeStepDs50{
+					KnownTimeStepDs50: 0.001,
+				},
+			},
+			Tasks: []*apiv1.EphemTask{
+				{
+					TaskId: 1,
+					Sat: &apiv1.Satellite{
+						NoradId: testNoradID,
+						Name:    testSatName,
+						TleLn1:  testTLELine1,
+						TleLn2:  testTLELine2,
+					},
+				},
+			},
+			ChunkPoints: chunkPoints,
+		}
+	}
+
+	// Default chunking, StreamChunkSize = 10 in the test config
+	defaultResps := recvAllEphem(ctx, t, client, newReq(0))
+	chunkedResps := recvAllEphem(ctx, t, client, newReq(chunkPoints))
+
+	var defaultPoints, chunkedPoints int64
+	for _, resp := range defaultResps {
+		defaultPoints += resp.GetResult().GetEphemPointsCount()
+	}
+	for _, resp := range chunkedResps {
+		count := resp.GetResult().GetEphemPointsCount()
+		if count > chunkPoints {
+			t.Errorf("Chunk %d has %d points, want at most %d", resp.GetStreamChunkId(), count, chunkPoints)
+		}
+		chunkedPoints += count
+	}
+
+	if defaultPoints == 0 {
+		t.Fatal("Expected ephemeris points with default chunking")
+	}
+	if chunkedPoints != defaultPoints {
+		t.Errorf("Total points with chunk_points=%d: %d, want %d (default chunking)", chunkPoints, chunkedPoints, defaultPoints)
+	}
+	if len(chunkedResps) >= len(defaultResps) {
+		t.Errorf("Expected fewer chunks with chunk_points=%d: got %d, default chunking %d", chunkPoints, len(chunkedResps), len(defaultResps))
+	}
+
+	t.Logf("chunk_points=%d: %d chunks, default: %d chunks, %d points", chunkPoints, len(chunkedResps), len(defaultResps), chunkedPoints)
+}
+
+func TestAPI_Ephem_FlatEphemData(t *testing.T) {
+	ts := newTestServer(t)
+	defer ts.close()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 60*time.Second)
+	defer cancel()
+
+	conn, err := ts.dial(ctx)
+	if err != nil {
+		t.Fatalf("Failed to dial: %v", err)
+	}
+	defer conn.Close()
+
+	client := apiv1.NewPropagatorClient(conn)
+
+	newReq := func(flat bool) *apiv1.EphemRequest {
+		return &apiv1.EphemRequest{
+			ReqId:     96,
+			EphemType: apiv1.EphemType_EphemEci,
+			CommonTimeGrid: &apiv1.EphemTimeGrid{
+				TimeStartDs50: 27744.0,
+				TimeEndDs50:   27744.1,
+				TimeStepType: &apiv1.EphemTimeGrid_KnownTimeStepDs50{
+					KnownTimeStepDs50: 0.001,
+				},
+			},
+			Tasks: []*apiv1.EphemTask{
+				{
+					TaskId: 100,
+					Sat: &apiv1.Satellite{
+						NoradId: testNoradID,
+						Name:    testSatName,
+						TleLn1:  testTLELine1,
+						TleLn2:  testTLELine2,
+					},
+				},
+			},
+			FlatEphemData: flat,
+		}
+	}
+
+	dataResps := recvAllEphem(ctx, t, client, newReq(false))
+	flatResps := recvAllEphem(ctx, t, client, newReq(true))
+
+	if len(flatResps) == 0 {
+		t.Fatal("Expected at least one response")
+	}
+	if len(flatResps) != len(dataResps) {
+		t.Fatalf("Got %d flat chunks, want %d (same as ephem_data)", len(flatResps), len(dataResps))
+	}
+
+	for i, resp := range flatResps {
+		result := resp.GetResult()
+		count := result.GetEphemPointsCount()
+
+		// Verify the flat bytes hold exactly 7 doubles per declared point
+		flat := result.GetEphemDataFlat()
+		if int64(len(flat)) != 7*8*count {
+			t.Fatalf("Chunk %d: %d flat bytes for %d points, want %d", i, len(flat), count, 7*8*count)
+		}
+		if len(result.GetEphemData()) != 0 {
+			t.Errorf("Chunk %d: ephem_data should be empty when flat data is requested", i)
+		}
+
+		// Verify the values match the ephem_data path for the same grid
+		points := dataResps[i].GetResult().GetEphemData()
+		if int64(len(points)) != count {
+			t.Fatalf("Chunk %d: %d points, ephem_data chunk has %d", i, count, len(points))
+		}
+		for j, p := range points {
+			want := []float64{p.GetDs50Time(), p.GetX(), p.GetY(), p.GetZ(), p.GetVx(), p.GetVy(), p.GetVz()}
+			for k, w := range want {
+				got := math.Float64frombits(binary.LittleEndian.Uint64(flat[(j*7+k)*8:]))
+				if got != w {
+					t.Errorf("Chunk %d point %d value %d = %v, want %v", i, j, k, got, w)
+				}
+			}
+		}
+	}
+
+	t.Logf("Flat ephemeris data verified: %d chunks", len(flatResps))
+}
+
+func TestAPI_Ephem_BufferHint_MultipleTasks(t *testing.T) {
+	ts := newTestServer(t)
+	defer ts.close()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 60*time.Second)
+	defer cancel()
+
+	conn, err := ts.dial(ctx)
+	if err != nil {
+		t.Fatalf("Failed to dial: %v", err)
+	}
+	defer conn.Close()
+
+	client := apiv1.NewPropagatorClient(conn)
+
+	newReq := func(bufferHint bool) *apiv1.EphemRequest {
+		sat1 := &apiv1.Satellite{NoradId: testNoradID, Name: testSatName, TleLn1: testTLELine1, TleLn2: testTLELine2}
+		sat2 := &apiv1.Satellite{NoradId: testNoradID_2, Name: testSatName_2, TleLn1: testTLELine1_2, TleLn2: testTLELine2_2}
+		return &apiv1.EphemRequest{
+			ReqId:     97,
+			EphemType: apiv1.EphemType_EphemEci,
+			CommonTimeGrid: &apiv1.EphemTimeGrid{
+				TimeStartDs50: 27744.0,
+				TimeEndDs50:   27744.1,
+				TimeStepType: &apiv1.EphemTimeGrid_KnownTimeStepDs50{
+					KnownTimeStepDs50: 0.001,
+				},
+			},
+			Tasks: []*apiv1.EphemTask{
+				{TaskId: 1, Sat: sat1},
+				{TaskId: 2, Sat: sat2},
+				{TaskId: 3, Sat: sat1},
+			},
+			BufferHint: bufferHint,
+		}
+	}
+
+	// The chunks of one task stay far below the flush threshold, so everything is sent by the
+	// flush at the end of each task
+	plainResps := recvAllEphem(ctx, t, client, newReq(false))
+	hintResps := recvAllEphem(ctx, t, client, newReq(true))
+
+	if len(hintResps) != len(plainResps) {
+		t.Fatalf("Got %d chunks with buffer_hint, want %d", len(hintResps), len(plainResps))
+	}
+
+	var lastStreamID, lastChunkID int64 = 0, -1
+	for i, resp := range hintResps {
+		streamID := resp.GetStreamId()
+		chunkID := resp.GetStreamChunkId()
+
+		// Verify tasks arrive in order and chunk IDs restart and stay sequential per task
+		switch {
+		case streamID == lastStreamID && chunkID == lastChunkID+1:
+		case streamID == lastStreamID+1 && chunkID == 0:
+		default:
+			t.Fatalf("Chunk %d out of order: stream %d chunk %d after stream %d chunk %d",
+				i, streamID, chunkID, lastStreamID, lastChunkID)
+		}
+		lastStreamID, lastChunkID = streamID, chunkID
+
+		want := plainResps[i]
+		if streamID != want.GetStreamId() || chunkID != want.GetStreamChunkId() ||
+			resp.GetResult().GetTaskId() != want.GetResult().GetTaskId() ||
+			resp.GetResult().GetEphemPointsCount() != want.GetResult().GetEphemPointsCount() {
+			t.Errorf("Chunk %d = stream %d chunk %d task %d (%d points), want stream %d chunk %d task %d (%d points)",
+				i, streamID, chunkID, resp.GetResult().GetTaskId(), resp.GetResult().GetEphemPointsCount(),
+				want.GetStreamId(), want.GetStreamChunkId(), want.GetResult().GetTaskId(), want.GetResult().GetEphemPointsCount())
+		}
+	}
+
+	// The last task is only sent by its end of task flush
+	if lastStreamID != 2 {
+		t.Errorf("Last chunk belongs to stream %d, want 2", lastStreamID)
+	}
+
+	t.Logf("buffer_hint verified: %d chunks over %d tasks", len(hintResps), lastStreamID+1)
+}
+
 // =============================================================================
 // Error Handling Tests
 // =============================================================================
@@ -25,10 +25,14 @@
 package core
 
 import (
+	"encoding/binary"
+	"errors"
+	"math"
 	"testing"
 	"time"
 
 	apiv1 "github.com/xpropagation/xpropagator/api/v1/gen"
+	"github.com/xpropagation/xpropagator/internal/values"
 	"google.golang.org/protobuf/types/known/timestamppb"
 )
 
@@ -192,6 +196,108 @@ func TestValidatePropRequest_BothUTCAndDS50Time(t *testing.T) {
 	}
 }
 
+func TestValidatePropRequest_TimesGiven(t *testing.T) {
+	req := &apiv1.PropRequest{
+		ReqId:    1,
+		TimeType: apiv1.TimeType_TimeDs50,
+		Task: &apiv1.PropTask{
+			Time: 27744.5,
+			Sat: &apiv1.Satellite{
+				NoradId: 25544,
+				Name:    "ISS",
+				TleLn1:  "1 25544U 98067A   21275.52543210  .00016717  00000-0  10270-3 0  9042",
+				TleLn2:  "2 25544  51.6442 208.5453 0003439  47.4501  63.9527 15.48881544315506",
+			},
+		},
+		Times: []float64{27744.5, 27744.75},
+	}
+
+	err := validatePropRequest(req)
+	if err == nil {
+		t.Error("Expected error when times are given to Prop")
+	}
+}
+
+// =============================================================================
+// PropStream Request Validation Tests
+// =============================================================================
+
+func TestValidatePropStreamRequest_Valid(t *testing.T) {
+	req := &apiv1.PropRequest{
+		ReqId:    1,
+		TimeType: apiv1.TimeType_TimeDs50,
+		Task: &apiv1.PropTask{
+			Sat: &apiv1.Satellite{
+				NoradId: 25544,
+				Name:    "ISS",
+				TleLn1:  "1 25544U 98067A   21275.52543210  .00016717  00000-0  10270-3 0  9042",
+				TleLn2:  "2 25544  51.6442 208.5453 0003439  47.4501  63.9527 15.48881544315506",
+			},
+		},
+		Times: []float64{27744.5, 27744.75, 27745.0},
+	}
+
+	err := validatePropStreamRequest(req)
+	if err != nil {
+		t.Errorf("Expected valid request, got error: %v", err)
+	}
+}
+
+func TestValidatePropStreamRequest_NilTask(t *testing.T) {
+	req := &apiv1.PropRequest{
+		ReqId:    1,
+		TimeType: apiv1.TimeType_TimeDs50,
+		Times:    []float64{27744.5},
+	}
+
+	err := validatePropStreamRequest(req)
+	if err == nil {
+		t.Error("Expected error for nil task")
+	}
+}
+
+func TestValidatePropStreamRequest_NoTimes(t *testing.T) {
+	req := &apiv1.PropRequest{
+		ReqId:    1,
+		TimeType: apiv1.TimeType_TimeDs50,
+		Task: &apiv1.PropTask{
+			Sat: &apiv1.Satellite{
+				NoradId: 25544,
+				Name:    "ISS",
+				TleLn1:  "1 25544U 98067A   21275.52543210  .00016717  00000-0  10270-3 0  9042",
+				TleLn2:  "2 25544  51.6442 208.5453 0003439  47.4501  63.9527 15.48881544315506",
+			},
+		},
+	}
+
+	err := validatePropStreamRequest(req)
+	if err == nil {
+		t.Error("Expected error when no times are given")
+	}
+}
+
+func TestValidatePropStreamRequest_TaskTimeGiven(t *testing.T) {
+	req := &apiv1.PropRequest{
+		ReqId:    1,
+		TimeType: apiv1.TimeType_TimeDs50,
+		Task: &apiv1.PropTask{
+			Time: 27744.5,
+			Sat: &apiv1.Satellite{
+				NoradId: 25544,
+				Name:    "ISS",
+				TleLn1:  "1 25544U 98067A   21275.52543210  .00016717  00000-0  10270-3 0  9042",
+				TleLn2:  "2 25544  51.6442 208.5453 0003439  47.4501  63.9527 15.48881544315506",
+			},
+		},
+		Times: []float64{27744.75},
+	}
+
+	err := validatePropStreamRequest(req)
+	if err == nil {
+		t.Error("Expected error when task time is given together with times")
+	}
+}
+
 // =============================================================================
 // Ephem Request Validation Tests
 // =============================================================================
@@ -300,6 +406,90 @@ func TestValidateAnalytEphemRequest_InvalidEphemType(t *testing.T) {
 	}
 }
 
+func TestValidateAnalytEphemRequest_Valid_ChunkPoints(t *testing.T) {
+	req := &apiv1.EphemRequest{
+		ReqId:     1,
+		EphemType: apiv1.EphemType_EphemEci,
+		CommonTimeGrid: &apiv1.EphemTimeGrid{
+			TimeStartDs50: 27744.0,
+			TimeEndDs50:   27754.0,
+		},
+		Tasks: []*apiv1.EphemTask{
+			{
+				TaskId: 1,
+				Sat: &apiv1.Satellite{
+					NoradId: 25544,
+					Name:    "ISS",
+					TleLn1:  "1 25544U 98067A   21275.52543210  .00016717  00000-0  10270-3 0  9042",
+					TleLn2:  "2 25544  51.6442 208.5453 0003439  47.4501  63.9527 15.48881544315506",
+				},
+			},
+		},
+		ChunkPoints: 512,
+	}
+
+	err := validateAnalytEphemRequest(req)
+	if err != nil {
+		t.Errorf("Expected valid request, got error: %v", err)
+	}
+}
+
+func TestValidateAnalytEphemRequest_NegativeChunkPoints(t *testing.T) {
+	req := &apiv1.EphemRequest{
+		ReqId:     1,
+		EphemType: apiv1.EphemType_EphemEci,
+		CommonTimeGrid: &apiv1.EphemTimeGrid{
+			TimeStartDs50: 27744.0,
+			TimeEndDs50:   27754.0,
+		},
+		Tasks: []*apiv1.EphemTask{
+			{
+				TaskId: 1,
+				Sat: &apiv1.Satellite{
+					NoradId: 25544,
+					Name:    "ISS",
+					TleLn1:  "1 25544U 98067A   21275.52543210  .00016717  00000-0  10270-3 0  9042",
+					TleLn2:  "2 25544  51.6442 208.5453 0003439  47.4501  63.9527 15.48881544315506",
+				},
+			},
+		},
+		ChunkPoints: -1,
+	}
+
+	err := validateAnalytEphemRequest(req)
+	if err == nil {
+		t.Error("Expected error for negative chunk points")
+	}
+}
+
+func TestValidateAnalytEphemRequest_ChunkPointsAboveMax(t *testing.T) {
+	req := &apiv1.EphemRequest{
+		ReqId:     1,
+		EphemType: apiv1.EphemType_EphemEci,
+		CommonTimeGrid: &apiv1.EphemTimeGrid{
+			TimeStartDs50: 27744.0,
+			TimeEndDs50:   27754.0,
+		},
+		Tasks: []*apiv1.EphemTask{
+			{
+				TaskId: 1,
+				Sat: &apiv1.Satellite{
+					NoradId: 25544,
+					Name:    "ISS",
+					TleLn1:  "1 25544U 98067A   21275.52543210  .00016717  00000-0  10270-3 0  9042",
+					TleLn2:  "2 25544  51.6442 208.5453 0003439  47.4501  63.9527 15.48881544315506",
+				},
+			},
+		},
+		ChunkPoints: values.MaxEphemChunkPoints + 1,
+	}
+
+	err := validateAnalytEphemRequest(req)
+	if err == nil {
+		t.Error("Expected error for chunk points above max")
+	}
+}
+
 func TestValidateAnalytEphemRequest_NoTimeGrid(t *testing.T) {
 	req := &apiv1.EphemRequest{
 		ReqId:          1,
@@ -721,6 +911,181 @@ func TestFlatEphemsToEphemDataArr_SinglePoint(t *testing.T) {
 	}
 }
 
+// =============================================================================
+// Ephem Response Building Tests
+// =============================================================================
+
+func TestBuildEphemResponse_EphemData(t *testing.T) {
+	req := &apiv1.EphemRequest{ReqId: 1}
+	task := &apiv1.EphemTask{TaskId: 10}
+	flat := []float64{
+		27744.5, 6632.4, -963.4, -301.9, 0.98, 4.99, 5.79,
+		27744.6, 6633.4, -964.4, -302.9, 0.99, 5.00, 5.80,
+	}
+
+	resp, err := buildEphemResponse(req, task, 2, flat, 2, 3)
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+
+	if resp.GetReqId() != 1 || resp.GetStreamId() != 2 || resp.GetStreamChunkId() != 3 {
+		t.Errorf("Unexpected stream metadata: %v", resp)
+	}
+	if len(resp.GetResult().GetEphemData()) != 2 {
+		t.Errorf("Expected 2 ephemeris points, got %d", len(resp.GetResult().GetEphemData()))
+	}
+	if len(resp.GetResult().GetEphemDataFlat()) != 0 {
+		t.Error("Flat ephemeris data should be empty when not requested")
+	}
+}
+
+func TestBuildEphemResponse_FlatEphemData(t *testing.T) {
+	req := &apiv1.EphemRequest{ReqId: 1, FlatEphemData: true}
+	task := &apiv1.EphemTask{TaskId: 10}
+	flat := []float64{
+		27744.5, 6632.4, -963.4, -301.9, 0.98, 4.99, 5.79,
+		27744.6, 6633.4, -964.4, -302.9, 0.99, 5.00, 5.80,
+	}
+
+	resp, err := buildEphemResponse(req, task, 0, flat, 2, 0)
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+
+	if len(resp.GetResult().GetEphemData()) != 0 {
+		t.Error("Ephemeris points should be empty when flat data is requested")
+	}
+	if len(resp.GetResult().GetEphemDataFlat()) != len(flat)*8 {
+		t.Errorf("Expected %d flat bytes, got %d", len(flat)*8, len(resp.GetResult().GetEphemDataFlat()))
+	}
+	if resp.GetResult().GetEphemPointsCount() != 2 {
+		t.Errorf("Expected 2 ephemeris points, got %d", resp.GetResult().GetEphemPointsCount())
+	}
+}
+
+func TestBuildEphemResponse_FlatEphemData_CountMismatch(t *testing.T) {
+	req := &apiv1.EphemRequest{ReqId: 1, FlatEphemData: true}
+	task := &apiv1.EphemTask{TaskId: 10}
+	flat := []float64{27744.5, 6632.4, -963.4, -301.9, 0.98, 4.99, 5.79}
+
+	_, err := buildEphemResponse(req, task, 0, flat, 2, 0)
+	if err == nil {
+		t.Error("Expected error for flat array not matching points count")
+	}
+}
+
+func TestPackFloat64s_LittleEndianDoubles(t *testing.T) {
+	vals := []float64{27744.5, -963.4, 0, math.Inf(1)}
+
+	buf := packFloat64s(vals)
+	if len(buf) != len(vals)*8 {
+		t.Fatalf("Expected %d bytes, got %d", len(vals)*8, len(buf))
+	}
+
+	for i, want := range vals {
+		got := math.Float64frombits(binary.LittleEndian.Uint64(buf[i*8:]))
+		if got != want {
+			t.Errorf("Value %d = %v, want %v", i, got, want)
+		}
+	}
+}
+
+func TestSendResults_PreservesOrder(t *testing.T) {
+	for _, flushBytes := range []int{0, 1, values.EphemBufferHintFlushBytes} {
+		resultsCh := make(chan *apiv1.EphemResponse, 6)
+		for i, streamID := range []int64{0, 0, 0, 1, 1, 2} {
+			resultsCh <- &apiv1.EphemResponse{StreamId: streamID, StreamChunkId: int64(i)}
+		}
+		close(resultsCh)
+
+		var sent []int64
+		err := sendResults(resultsCh, flushBytes, func(res *apiv1.EphemResponse) error {
+			sent = append(sent, res.GetStreamChunkId())
+			return nil
+		})
+		if err != nil {
+			t.Fatalf("flushBytes %d: unexpected error: %v", flushBytes, err)
+		}
+
+		if len(sent) != 6 {
+			t.Fatalf("flushBytes %d: expected 6 responses sent, got %d", flushBytes, len(sent))
+		}
+		for i, id := range sent {
+			if id != int64(i) {
+				t.Errorf("flushBytes %d: expected chunk %d at position %d, got %d", flushBytes, i, i, id)
+			}
+		}
+	}
+}
+
+func TestSendResults_FlushesAtTaskEnd(t *testing.T) {
+	resultsCh := make(chan *apiv1.EphemResponse)
+	sentCh := make(chan *apiv1.EphemResponse, 2)
+	errCh := make(chan error, 1)
+
+	go func() {
+		errCh <- sendResults(resultsCh, values.EphemBufferHintFlushBytes, func(res *apiv1.EphemResponse) error {
+			sentCh <- res
+			return nil
+		})
+	}()
+
+	resultsCh <- &apiv1.EphemResponse{StreamId: 0, StreamChunkId: 0}
+	resultsCh <- &apiv1.EphemResponse{StreamId: 0, StreamChunkId: 1}
+	resultsCh <- nil // end of task 0
+
+	// Task 1 has produced nothing yet, the tail of task 0 must already be sent
+	for i := int64(0); i < 2; i++ {
+		select {
+		case res := <-sentCh:
+			if res.GetStreamId() != 0 || res.GetStreamChunkId() != i {
+				t.Errorf("Expected stream 0 chunk %d, got stream %d chunk %d", i, res.GetStreamId(), res.GetStreamChunkId())
+			}
+		case <-time.After(time.Second):
+			t.Fatalf("Chunk %d of task 0 not sent at the end of the task", i)
+		}
+	}
+
+	close(resultsCh)
+	if err := <-errCh; err != nil {
+		t.Errorf("Unexpected error: %v", err)
+	}
+}
+
+func TestSendResults_IgnoresTaskEndWithoutBuffering(t *testing.T) {
+	resultsCh := make(chan *apiv1.EphemResponse, 3)
+	resultsCh <- &apiv1.EphemResponse{StreamChunkId: 0}
+	resultsCh <- nil
+	resultsCh <- &apiv1.EphemResponse{StreamChunkId: 1}
+	close(resultsCh)
+
+	var sent []*apiv1.EphemResponse
+	err := sendResults(resultsCh, 0, func(res *apiv1.EphemResponse) error {
+		sent = append(sent, res)
+		return nil
+	})
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+	if len(sent) != 2 {
+		t.Errorf("Expected 2 responses sent, got %d", len(sent))
+	}
+}
+
+func TestSendResults_ReturnsSendError(t *testing.T) {
+	resultsCh := make(chan *apiv1.EphemResponse, 1)
+	resultsCh <- &apiv1.EphemResponse{}
+	close(resultsCh)
+
+	sendErr := errors.New("send failed")
+	err := sendResults(resultsCh, values.EphemBufferHintFlushBytes, func(*apiv1.EphemResponse) error {
+		return sendErr
+	})
+	if !errors.Is(err, sendErr) {
+		t.Errorf("Expected send error, got %v", err)
+	}
+}
+
 // =============================================================================
 // Time Grid Resolution Tests
 // =============================================================================
@@ -769,6 +1134,49 @@ func TestResolveTimeGrid_UsesCommonGrid(t *testing.T) {
 	}
 }
 
+func TestResolveChunkSize_UsesRequestChunkPoints(t *testing.T) {
+	req := &apiv1.EphemRequest{
+		ChunkPoints: 512,
+	}
+
+	if got := resolveChunkSize(req, 100); got != 512 {
+		t.Errorf("Expected chunk size 512, got %d", got)
+	}
+}
+
+func TestResolveChunkSize_UsesDefault(t *testing.T) {
+	req := &apiv1.EphemRequest{}
+
+	if got := resolveChunkSize(req, 100); got != 100 {
+		t.Errorf("Expected default chunk size 100, got %d", got)
+	}
+}
+
+func TestResolveResultsBufSize_DefaultChunkSize(t *testing.T) {
+	if got := resolveResultsBufSize(100, 100); got != 100 {
+		t.Errorf("Expected 100 buffered chunks, got %d", got)
+	}
+}
+
+func TestResolveResultsBufSize_BoundsBufferedPoints(t *testing.T) {
+	const defaultSize = 100
+
+	for _, chunkSize := range []int{1, 50, 100, 512, 2500, values.MaxEphemChunkPoints} {
+		bufSize := resolveResultsBufSize(defaultSize, chunkSize)
+		if bufSize < 1 {
+			t.Errorf("chunk size %d: buffer size %d, want at least 1", chunkSize, bufSize)
+		}
+		// Never more points than the default chunking buffers, or a single chunk if that is larger
+		if points := bufSize * chunkSize; points > max(defaultSize*defaultSize, chunkSize) {
+			t.Errorf("chunk size %d: %d buffered points, want at most %d", chunkSize, points, max(defaultSize*defaultSize, chunkSize))
+		}
+	}
+
+	if got := resolveResultsBufSize(defaultSize, values.MaxEphemChunkPoints); got != 1 {
+		t.Errorf("Expected 1 buffered chunk of %d points, got %d", values.MaxEphemChunkPoints, got)
+	}
+}
+
 // =============================================================================
 // Time Step Tests
 // =============================================================================
@@ -27,7 +27,9 @@ package core
 import "C"
 import (
 	"context"
+	"encoding/binary"
 	"fmt"
+	"math"
 	"time"
 
 	"github.com/sosodev/duration"
@@ -35,9 +37,11 @@ import (
 	"github.com/xpropagation/xpropagator/internal/config"
 	"github.com/xpropagation/xpropagator/internal/core/gc"
 	"github.com/xpropagation/xpropagator/internal/dllcore"
+	"github.com/xpropagation/xpropagator/internal/values"
 	"go.uber.org/zap"
 	"google.golang.org/grpc/codes"
 	"google.golang.org/grpc/status"
+	"google.golang.org/protobuf/proto"
 )
 
 func NewPropagatorService(cfg *config.Config, logger *zap.Logger, satGC *gc.GC) *PropagationService {
@@ -71,7 +75,9 @@ func (propSrv *PropagationService) Ephem(req *apiv1.EphemRequest, srv apiv1.Prop
 	startTime := time.Now()
 	ctx := srv.Context()
 
-	resultsCh, errCh, senderDoneCh := propSrv.startResultSender(srv, propSrv.cfg.StreamChunkSize)
+	chunkSize := resolveChunkSize(req, propSrv.cfg.StreamChunkSize)
+	bufSize := resolveResultsBufSize(propSrv.cfg.StreamChunkSize, chunkSize)
+	resultsCh, errCh, senderDoneCh := propSrv.startResultSender(srv, bufSize, req.GetBufferHint())
 
 	for taskIdx, task := range req.GetTasks() {
 		select {
@@ -89,7 +95,7 @@ func (propSrv *PropagationService) Ephem(req *apiv1.EphemRequest, srv apiv1.Prop
 			return status.Errorf(codes.Internal, "failed to acquire satellite: %v", err)
 		}
 
-		err = propSrv.processTask(ctx, req, task, taskIdx, satKey, resultsCh, propSrv.cfg.StreamChunkSize)
+		err = propSrv.processTask(ctx, req, task, taskIdx, satKey, resultsCh, chunkSize)
 		if release != nil {
 			release()
 		}
@@ -106,6 +112,18 @@ func (propSrv *PropagationService) Ephem(req *apiv1.EphemRequest, srv apiv1.Prop
 			}
 			return err
 		}
+
+		// End of task marker: with buffer_hint the task's last chunks are flushed now,
+		// not only once the next task has produced its first chunk
+		if req.GetBufferHint() {
+			select {
+			case resultsCh <- nil:
+			case <-ctx.Done():
+				close(resultsCh)
+				<-senderDoneCh
+				return ctx.Err()
+			}
+		}
 	}
 
 	close(resultsCh)
@@ -126,26 +144,81 @@ func (propSrv *PropagationService) Ephem(req *apiv1.EphemRequest, srv apiv1.Prop
 func (propSrv *PropagationService) startResultSender(
 	srv apiv1.Propagator_EphemServer,
 	bufSize int,
+	bufferHint bool,
 ) (chan *apiv1.EphemResponse, chan error, chan struct{}) {
 	resultsCh := make(chan *apiv1.EphemResponse, bufSize)
 	errCh := make(chan error, 1)
 	doneCh := make(chan struct{}, 1)
 
+	flushBytes := 0
+	if bufferHint {
+		flushBytes = values.EphemBufferHintFlushBytes
+	}
+
 	go func() {
 		defer close(doneCh)
-		for res := range resultsCh {
-			if err := srv.Send(res); err != nil {
-				select {
-				case errCh <- err:
-				default:
-				}
-				return
+		if err := sendResults(resultsCh, flushBytes, srv.Send); err != nil {
+			select {
+			case errCh <- err:
+			default:
 			}
 		}
 	}()
 	return resultsCh, errCh, doneCh
 }
 
+// sendResults sends every response from resultsCh. With flushBytes > 0 responses are held back
+// until at least flushBytes are pending or the task ends (a nil marker or a stream id change), and
+// then sent back-to-back. Each response is still its own HTTP/2 DATA frame, but the transport writes
+// the batch with fewer buffer flushes and write syscalls.
+func sendResults(resultsCh <-chan *apiv1.EphemResponse, flushBytes int, send func(*apiv1.EphemResponse) error) error {
+	var pending []*apiv1.EphemResponse
+	pendingBytes := 0
+
+	flush := func() error {
+		for _, res := range pending {
+			if err := send(res); err != nil {
+				return err
+			}
+		}
+		pending = pending[:0]
+		pendingBytes = 0
+		return nil
+	}
+
+	for res := range resultsCh {
+		if res == nil {
+			if err := flush(); err != nil {
+				return err
+			}
+			continue
+		}
+
+		if flushBytes <= 0 {
+			if err := send(res); err != nil {
+				return err
+			}
+			continue
+		}
+
+		if len(pending) > 0 && pending[len(pending)-1].GetStreamId() != res.GetStreamId() {
+			if err := flush(); err != nil {
+				return err
+			}
+		}
+
+		pending = append(pending, res)
+		pendingBytes += proto.Size(res)
+		if pendingBytes >= flushBytes {
+			if err := flush(); err != nil {
+				return err
+			}
+		}
+	}
+
+	return flush()
+}
+
 func (propSrv *PropagationService) processTask(
 	ctx context.Context,
 	req *apiv1.EphemRequest,
@@ -165,6 +238,22 @@ func resolveTimeGrid(task *apiv1.EphemTask, req *apiv1.EphemRequest) *apiv1.Ephe
 	return req.GetCommonTimeGrid()
 }
 
+func resolveChunkSize(req *apiv1.EphemRequest, defaultSize int) int {
+	if req.GetChunkPoints() > 0 {
+		return int(req.GetChunkPoints())
+	}
+	return defaultSize
+}
+
+// resolveResultsBufSize sizes the results channel so it holds about as many points as defaultSize
+// chunks of defaultSize points, whatever chunk size the request asked for.
+func resolveResultsBufSize(defaultSize int, chunkSize int) int {
+	if chunkSize <= 0 {
+		return defaultSize
+	}
+	return max(1, defaultSize*defaultSize/chunkSize)
+}
+
 func isDynamicTimeStep(grid *apiv1.EphemTimeGrid) bool {
 	t, ok := grid.TimeStepType.(*apiv1.EphemTimeGrid_DynamicTimeStep)
 	return ok && t.DynamicTimeStep
@@ -269,6 +358,16 @@ func flatEphemsToEphemDataArr(flatEphems []float64) ([]*apiv1.EphemerisData, err
 	return ephems, nil
 }
 
+// packFloat64s encodes vals as consecutive little-endian IEEE 754 doubles, the layout clients can
+// map without decoding (e.g. numpy.frombuffer(data, dtype="<f8")).
+func packFloat64s(vals []float64) []byte {
+	buf := make([]byte, len(vals)*8)
+	for i, v := range vals {
+		binary.LittleEndian.PutUint64(buf[i*8:], math.Float64bits(v))
+	}
+	return buf
+}
+
 func validateAnalytEphemRequest(req *apiv1.EphemRequest) error {
 	validateGrid := func(grid *apiv1.EphemTimeGrid) error {
 		if grid.GetTimeStartUtc() != nil && grid.GetTimeStartDs50() != 0 {
@@ -288,6 +387,10 @@ func validateAnalytEphemRequest(req *apiv1.EphemRequest) error {
 		return fmt.Errorf("request must have at least one task")
 	}
 
+	if req.GetChunkPoints() < 0 || req.GetChunkPoints() > values.MaxEphemChunkPoints {
+		return fmt.Errorf("invalid chunk points: %d (valid range: 0-%d, 0 uses the server stream chunk size)", req.GetChunkPoints(), values.MaxEphemChunkPoints)
+	}
+
 	if req.GetEphemType() != apiv1.EphemType(dllcore.EciEphemType) && req.GetEphemType() != apiv1.EphemType(dllcore.J2KEphemType) {
 		return fmt.Errorf("invalid ephemerides type: %v (valid types: ECI, J2K)", req.GetEphemType())
 	}
@@ -316,18 +419,28 @@ func validateAnalytEphemRequest(req *apiv1.EphemRequest) error {
 }
 
 func buildEphemResponse(req *apiv1.EphemRequest, task *apiv1.EphemTask, taskIdx int, flat []float64, count int, chunkID int) (*apiv1.EphemResponse, error) {
-	ephemDataArr, err := flatEphemsToEphemDataArr(flat)
-	if err != nil {
-		return nil, err
+	result := &apiv1.EphemOut{
+		TaskId:           task.GetTaskId(),
+		EphemPointsCount: int64(count),
 	}
+
+	if req.GetFlatEphemData() {
+		if len(flat) != count*7 {
+			return nil, fmt.Errorf("flat ephemerides array length %d does not match %d points", len(flat), count)
+		}
+		result.EphemDataFlat = packFloat64s(flat)
+	} else {
+		ephemDataArr, err := flatEphemsToEphemDataArr(flat)
+		if err != nil {
+			return nil, err
+		}
+		result.EphemData = ephemDataArr
+	}
+
 	return &apiv1.EphemResponse{
 		ReqId:         req.GetReqId(),
 		StreamId:      int64(taskIdx),
 		StreamChunkId: int64(chunkID),
-		Result: &apiv1.EphemOut{
-			TaskId:           task.GetTaskId(),
-			EphemData:        ephemDataArr,
-			EphemPointsCount: int64(count),
-		},
+		Result:        result,
 	}, nil
 }
@@ -64,15 +64,81 @@ func (propSrv *PropagationService) Prop(ctx context.Context, req *apiv1.PropRequ
 		}
 	}()
 
-	res := &apiv1.EphemerisData{}
-
 	if req.GetTask().GetTimeUtc() != nil {
 		req.GetTask().Time = UtcToDS50(req.GetTask().GetTimeUtc().AsTime())
 		req.TimeType = apiv1.TimeType_TimeDs50
 	}
 
-	err = core_helpers.WithDllCall(ctx, func() int {
-		flatArr, rc := dllcore.Sgp4PropAll(satKey, dllcore.TimeType(req.GetTimeType()), req.GetTask().GetTime())
+	res, err := propagateAt(ctx, satKey, req.GetTimeType(), req.GetTask().GetTime())
+	if err != nil {
+		return nil, err
+	}
+
+	resp := &apiv1.PropResponse{
+		ReqId:  req.GetReqId(),
+		Result: res,
+	}
+
+	propSrv.logger.Info("analytical propagation done", zap.Duration("time took", time.Since(startTime)))
+
+	//if propSrv.cfg.StatelessMode {
+	//	return nil, gc.GlobalGC.RemoveAll(ctx)
+	//}
+
+	return resp, nil
+}
+
+// PropStream propagates one satellite to every time in req.Times and streams back one PropResponse
+// per time, in request order, so N epochs cost a single RPC instead of N unary Prop calls.
+func (propSrv *PropagationService) PropStream(req *apiv1.PropRequest, srv apiv1.Propagator_PropStreamServer) error {
+	if err := validatePropStreamRequest(req); err != nil {
+		return status.Error(codes.InvalidArgument, err.Error())
+	}
+
+	globMu.Lock()
+	defer globMu.Unlock()
+
+	startTime := time.Now()
+	ctx := srv.Context()
+
+	satKey, release, err := propSrv.gc.Acquire(ctx, req.GetTask().GetSat().GetTleLn1(), req.GetTask().GetSat().GetTleLn2())
+	if err != nil {
+		return status.Errorf(codes.Internal, "failed to acquire satellite: %v", err)
+	}
+	defer func() {
+		if release != nil {
+			release()
+		}
+	}()
+
+	for _, t := range req.GetTimes() {
+		select {
+		case <-ctx.Done():
+			return ctx.Err()
+		default:
+		}
+
+		res, err := propagateAt(ctx, satKey, req.GetTimeType(), t)
+		if err != nil {
+			return err
+		}
+
+		if err := srv.Send(&apiv1.PropResponse{ReqId: req.GetReqId(), Result: res}); err != nil {
+			return err
+		}
+	}
+
+	propSrv.logger.Info("analytical stream propagation done",
+		zap.Int("times", len(req.GetTimes())),
+		zap.Duration("time took", time.Since(startTime)))
+	return nil
+}
+
+func propagateAt(ctx context.Context, satKey int64, timeType apiv1.TimeType, t float64) (*apiv1.EphemerisData, error) {
+	res := &apiv1.EphemerisData{}
+
+	err := core_helpers.WithDllCall(ctx, func() int {
+		flatArr, rc := dllcore.Sgp4PropAll(satKey, dllcore.TimeType(timeType), t)
 		if rc != 0 || len(flatArr) < 8 {
 			return rc
 		}
@@ -91,19 +157,7 @@ func (propSrv *PropagationService) Prop(ctx context.Context, req *apiv1.PropRequ
 	if err != nil {
 		return nil, err
 	}
-
-	resp := &apiv1.PropResponse{
-		ReqId:  req.GetReqId(),
-		Result: res,
-	}
-
-	propSrv.logger.Info("analytical propagation done", zap.Duration("time took", time.Since(startTime)))
-
-	//if propSrv.cfg.StatelessMode {
-	//	return nil, gc.GlobalGC.RemoveAll(ctx)
-	//}
-
-	return resp, nil
+	return res, nil
 }
 
 func validatePropRequest(req *apiv1.PropRequest) error {
@@ -117,6 +171,9 @@ func validatePropRequest(req *apiv1.PropRequest) error {
 	if req.GetTimeType() != apiv1.TimeType_TimeMse && req.GetTimeType() != apiv1.TimeType_TimeDs50 {
 		return fmt.Errorf("invalid time type: %v (valid types: MSE, DS50)", req.GetTimeType())
 	}
+	if len(req.GetTimes()) > 0 {
+		return errors.New("times can only be given to PropStream, use task time or time_utc for Prop")
+	}
 	if req.GetTask().GetTimeUtc() != nil && req.GetTask().GetTime() > 0 {
 		return fmt.Errorf("time cannot be given in DS50 or MSE %v, a UTC time already specified", req.GetTask().GetTime())
 	}
@@ -126,3 +183,23 @@ func validatePropRequest(req *apiv1.PropRequest) error {
 	}
 	return nil
 }
+
+func validatePropStreamRequest(req *apiv1.PropRequest) error {
+	if req.GetTask() == nil {
+		return errors.New("task is required")
+	}
+	if err := validateSatellite(req.GetTask().GetSat()); err != nil {
+		return err
+	}
+
+	if req.GetTimeType() != apiv1.TimeType_TimeMse && req.GetTimeType() != apiv1.TimeType_TimeDs50 {
+		return fmt.Errorf("invalid time type: %v (valid types: MSE, DS50)", req.GetTimeType())
+	}
+	if len(req.GetTimes()) == 0 {
+		return errors.New("at least one time is required")
+	}
+	if req.GetTask().GetTimeUtc() != nil || req.GetTask().GetTime() != 0 {
+		return errors.New("task time and time_utc are not used by PropStream, give the times in times")
+	}
+	return nil
+}
@@ -24,6 +24,8 @@
 
 package values
 
+import "time"
+
 var (
 	Version    string
 	CommitHash string
@@ -46,6 +48,12 @@ const (
 	DefaultTLSCaFilePath          = "certs/ca.crt"
 )
 
+const MaxEphemChunkPoints = 10000
+
+const EphemBufferHintFlushBytes = 64 * 1024
+
+const KeepaliveMinTime = 20 * time.Second
+
 const (
 	HostEnvKey                   = "SERVICE_HOST"
 	PortEnvKey                   = "SERVICE_PORT"
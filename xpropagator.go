@@ -45,8 +45,10 @@ import (
 	"go.uber.org/zap"
 	"google.golang.org/grpc"
 	"google.golang.org/grpc/credentials"
+	_ "google.golang.org/grpc/encoding/gzip"
 	"google.golang.org/grpc/health"
 	healthpb "google.golang.org/grpc/health/grpc_health_v1"
+	"google.golang.org/grpc/keepalive"
 	"google.golang.org/grpc/reflection"
 )
 
@@ -67,6 +69,10 @@ func newGRPCServer(params GRPCServerParams) (GRPCServerResult, error) {
 	opts := []grpc.ServerOption{
 		grpc.UnaryInterceptor(core.LoggingInterceptor(params.Logger)),
 		grpc.StreamInterceptor(core.LoggingStreamInterceptor(params.Logger)),
+		grpc.KeepaliveEnforcementPolicy(keepalive.EnforcementPolicy{
+			MinTime:             values.KeepaliveMinTime,
+			PermitWithoutStream: true,
+		}),
 	}
 
 	if params.Config.TLS.Enabled {